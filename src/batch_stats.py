@@ -0,0 +1,539 @@
+"""
+Pitch Pine Trail - Forest Management Simulation Game
+
+NJ Forest Service
+William Zipse
+Cara Escalona
+Justin Gimmillaro
+
+---------------------------------------------------
+Mergeable streaming statistics for sharded Monte Carlo batch runs.
+
+A study plays many seeded games with one policy. The study can be split into
+N shard specs, each run on a different machine, and the compact partial
+results merged back together without shipping raw trajectories. Every
+accumulator merges associatively, so the merged numbers match a single-node
+run (exactly for counts, histograms and quantile sketches; to floating point
+round-off for means and variances).
+
+Usage:
+    python src/batch_stats.py plan --runs 10000 --shards 4 --seed 7 --out shards/
+    python src/batch_stats.py run shards/shard_0.json --out partial_0.json
+    python src/batch_stats.py merge partial_*.json
+    python src/batch_stats.py local --runs 10000 --shards 4 --seed 7 --check
+"""
+
+import argparse
+import glob
+import json
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+from game_logic import Game
+from policies import make_scenarios, load_policy
+
+SHARD_FORMAT = 'pitch-pine-shard/1'
+STATS_FORMAT = 'pitch-pine-stats/1'
+METRICS = ('carbon', 'BA', 'TPA')
+
+
+class OutcomeCounts:
+    """Counts of each game outcome ('complete', 'wildfire', 'spb', 'low_ba')."""
+
+    def __init__(self):
+        """Start with no outcomes counted."""
+        self.counts = {}
+
+    def add(self, outcome):
+        """Count one game ending with ``outcome``."""
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+    def merge(self, other):
+        """Add another accumulator's counts into this one."""
+        for outcome, count in other.counts.items():
+            self.counts[outcome] = self.counts.get(outcome, 0) + count
+        return self
+
+    def to_dict(self):
+        """Serialize to a JSON-compatible dict."""
+        return dict(sorted(self.counts.items()))
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild an accumulator from to_dict output."""
+        acc = cls()
+        acc.counts = dict(data)
+        return acc
+
+
+class RunningMoments:
+    """
+    Welford running mean and variance.
+
+    Attributes:
+        n (int): Number of values seen
+        mean (float): Running mean
+        m2 (float): Sum of squared deviations from the mean
+    """
+
+    def __init__(self):
+        """Start with no values seen."""
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x):
+        """Add one value (Welford update)."""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def merge(self, other):
+        """Combine with another accumulator (Chan et al. parallel update)."""
+        if other.n == 0:
+            return self
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        return self
+
+    @property
+    def variance(self):
+        """Sample variance (0.0 for fewer than two values)."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def to_dict(self):
+        """Serialize to a JSON-compatible dict."""
+        return {'n': self.n, 'mean': self.mean, 'm2': self.m2}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild an accumulator from to_dict output."""
+        acc = cls()
+        acc.n, acc.mean, acc.m2 = data['n'], data['mean'], data['m2']
+        return acc
+
+
+class QuantileSketch:
+    """
+    Log-bucketed quantile sketch for non-negative values.
+
+    Each value is counted in a bucket whose bounds grow geometrically, so any
+    quantile estimate is within ``relative_accuracy`` of the true value.
+    Merging just adds bucket counts, which makes it exact and associative.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        """
+        Create an empty sketch.
+
+        Args:
+            relative_accuracy (float): Maximum relative error of estimates
+        """
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.zero_count = 0
+        self.buckets = {}
+
+    @property
+    def count(self):
+        """Number of values in the sketch."""
+        return self.zero_count + sum(self.buckets.values())
+
+    def add(self, x):
+        """Count one value in its bucket (values <= 0 count as zero)."""
+        if x <= 0:
+            self.zero_count += 1
+            return
+        key = math.ceil(math.log(x) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+
+    def merge(self, other):
+        """
+        Add another sketch's bucket counts into this one.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        self.zero_count += other.zero_count
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        return self
+
+    def quantile(self, q):
+        """
+        Estimate the q-th quantile.
+
+        Args:
+            q (float): Quantile between 0 and 1
+
+        Returns:
+            float or None: Estimated value, or None if the sketch is empty
+        """
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def to_dict(self):
+        """Serialize to a JSON-compatible dict with sparse buckets."""
+        return {
+            'alpha': self.relative_accuracy,
+            'zero': self.zero_count,
+            'buckets': {str(k): v for k, v in sorted(self.buckets.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a sketch from to_dict output."""
+        acc = cls(data['alpha'])
+        acc.zero_count = data['zero']
+        acc.buckets = {int(k): v for k, v in data['buckets'].items()}
+        return acc
+
+
+class EventHistogram:
+    """Counts of each event type by the year it occurred."""
+
+    def __init__(self):
+        """Start with no events counted."""
+        self.counts = {}
+
+    def add(self, year, event, count=1):
+        """Count ``count`` occurrences of ``event`` in ``year``."""
+        by_year = self.counts.setdefault(event, {})
+        by_year[year] = by_year.get(year, 0) + count
+
+    def merge(self, other):
+        """Add another histogram's counts into this one."""
+        for event, by_year in other.counts.items():
+            for year, count in by_year.items():
+                self.add(year, event, count)
+        return self
+
+    def to_dict(self):
+        """Serialize to a JSON-compatible dict keyed by event, then year."""
+        return {
+            event: {str(year): count for year, count in sorted(by_year.items())}
+            for event, by_year in sorted(self.counts.items())
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a histogram from to_dict output."""
+        acc = cls()
+        acc.counts = {
+            event: {int(year): count for year, count in by_year.items()}
+            for event, by_year in data.items()
+        }
+        return acc
+
+
+class StudyStats:
+    """
+    All streaming statistics for a batch of games.
+
+    Attributes:
+        outcomes (OutcomeCounts): How each game ended
+        moments (dict): RunningMoments of final carbon, BA and TPA
+        sketches (dict): QuantileSketch of final carbon, BA and TPA
+        events (EventHistogram): Events by year across all games
+    """
+
+    def __init__(self):
+        """Start with empty accumulators."""
+        self.outcomes = OutcomeCounts()
+        self.moments = {m: RunningMoments() for m in METRICS}
+        self.sketches = {m: QuantileSketch() for m in METRICS}
+        self.events = EventHistogram()
+
+    def add_game(self, game, outcome):
+        """Record the final state of a finished game."""
+        self.outcomes.add(outcome)
+        for metric in METRICS:
+            self.moments[metric].add(game.stand[metric])
+            self.sketches[metric].add(game.stand[metric])
+        for year, event in game.stand['events']:
+            self.events.add(year, event)
+
+    def merge(self, other):
+        """Merge every accumulator of another StudyStats into this one."""
+        self.outcomes.merge(other.outcomes)
+        for metric in METRICS:
+            self.moments[metric].merge(other.moments[metric])
+            self.sketches[metric].merge(other.sketches[metric])
+        self.events.merge(other.events)
+        return self
+
+    def to_dict(self):
+        """Serialize all accumulators to a JSON-compatible dict."""
+        return {
+            'outcomes': self.outcomes.to_dict(),
+            'moments': {m: acc.to_dict() for m, acc in self.moments.items()},
+            'sketches': {m: acc.to_dict() for m, acc in self.sketches.items()},
+            'events': self.events.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a StudyStats from to_dict output."""
+        acc = cls()
+        acc.outcomes = OutcomeCounts.from_dict(data['outcomes'])
+        acc.moments = {m: RunningMoments.from_dict(d) for m, d in data['moments'].items()}
+        acc.sketches = {m: QuantileSketch.from_dict(d) for m, d in data['sketches'].items()}
+        acc.events = EventHistogram.from_dict(data['events'])
+        return acc
+
+
+# --- Shard specs and partial results ---
+
+def make_shard_specs(runs, shards, seed=0, action='1', policy=None, annual=False):
+    """
+    Split a study into independent shard specs.
+
+    Every shard sees the same list of per-run seeds, so the union of the
+    shards plays exactly the games a single-node run would.
+
+    Args:
+        runs (int): Total games in the study
+        shards (int): Number of shards
+        seed (int): Study seed
+        action (str): Fixed action played every turn when no policy is given
+        policy (str, optional): Path to a policy file defining policy(status)
+        annual (bool): Play games in annual-resolution mode
+
+    Returns:
+        list: Shard spec dicts
+    """
+    return [
+        {
+            'format': SHARD_FORMAT,
+            'seed': seed,
+            'runs': runs,
+            'action': action,
+            'policy': policy,
+            'annual': annual,
+            'shard': index,
+            'num_shards': shards,
+            'start': index * runs // shards,
+            'stop': (index + 1) * runs // shards,
+        }
+        for index in range(shards)
+    ]
+
+
+def _study_key(spec):
+    """Settings that must match for partial results to be merged."""
+    key = {k: spec[k] for k in ('seed', 'runs', 'action', 'policy', 'num_shards')}
+    key['annual'] = spec.get('annual', False)
+    return key
+
+
+def run_shard(spec):
+    """
+    Play the games of one shard.
+
+    Args:
+        spec (dict): Shard spec from make_shard_specs
+
+    Returns:
+        dict: Partial result holding the serialized StudyStats
+    """
+    if spec.get('format') != SHARD_FORMAT:
+        raise ValueError(f"Unsupported shard format: {spec.get('format')!r}")
+    if spec['policy']:
+        policy = load_policy(spec['policy'])
+    else:
+        def policy(status):
+            """Play the spec's fixed action every turn."""
+            return spec['action']
+
+    stats = StudyStats()
+    seeds = make_scenarios(spec['runs'], spec['seed'])
+    for seed in seeds[spec['start']:spec['stop']]:
+        game = Game(rng=random.Random(seed), annual=spec.get('annual', False))
+        outcome = None
+        while outcome is None:
+            outcome = game.get_outcome(game.play_turn(policy(game.get_status_dict())))
+        stats.add_game(game, outcome)
+
+    return {
+        'format': STATS_FORMAT,
+        'study': _study_key(spec),
+        'shards': [spec['shard']],
+        'stats': stats.to_dict(),
+    }
+
+
+def merge_partials(partials):
+    """
+    Merge partial results from shards of the same study.
+
+    Raises:
+        ValueError: If the partials belong to different studies or overlap
+    """
+    if not partials:
+        raise ValueError("No partial results to merge")
+    study = partials[0]['study']
+    shards = []
+    stats = StudyStats()
+    for partial in partials:
+        if partial.get('format') != STATS_FORMAT:
+            raise ValueError(f"Unsupported stats format: {partial.get('format')!r}")
+        if partial['study'] != study:
+            raise ValueError("Cannot merge results from different studies")
+        if set(partial['shards']) & set(shards):
+            raise ValueError(f"Shards merged twice: {partial['shards']}")
+        shards.extend(partial['shards'])
+        stats.merge(StudyStats.from_dict(partial['stats']))
+    return {
+        'format': STATS_FORMAT,
+        'study': study,
+        'shards': sorted(shards),
+        'stats': stats.to_dict(),
+    }
+
+
+def run_local(runs, shards, seed=0, action='1', policy=None, annual=False, workers=None):
+    """Run every shard in a separate local process and merge the results."""
+    specs = make_shard_specs(runs, shards, seed, action, policy, annual)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        partials = list(pool.map(run_shard, specs))
+    return merge_partials(partials)
+
+
+def format_report(result):
+    """Format a (merged) partial result as readable text."""
+    study = result['study']
+    stats = StudyStats.from_dict(result['stats'])
+    lines = [
+        f"Study: {study['runs']} runs, seed {study['seed']}, "
+        f"policy {study['policy'] or 'action ' + study['action']}"
+        + (", annual steps" if study.get('annual') else ""),
+        f"Shards merged: {len(result['shards'])}/{study['num_shards']}",
+        "",
+        "Outcomes: " + ", ".join(f"{k}: {v}" for k, v in stats.outcomes.to_dict().items()),
+        "",
+        f"{'Final':<8}{'Mean':>10}{'Std':>10}{'P10':>10}{'P50':>10}{'P90':>10}",
+    ]
+    for metric in METRICS:
+        moments, sketch = stats.moments[metric], stats.sketches[metric]
+        quantiles = [sketch.quantile(q) or 0.0 for q in (0.1, 0.5, 0.9)]
+        lines.append(
+            f"{metric:<8}{moments.mean:>10.2f}{math.sqrt(moments.variance):>10.2f}"
+            + "".join(f"{q:>10.2f}" for q in quantiles)
+        )
+    lines.append("")
+    lines.append("Events by year:")
+    for event, by_year in stats.events.to_dict().items():
+        lines.append(f"  {event} " + ", ".join(f"{y}: {c}" for y, c in by_year.items()))
+    return "\n".join(lines)
+
+
+def _write_json(path, data):
+    """Write data as compact JSON."""
+    with open(path, 'w') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+
+def _read_json(path):
+    """Read a JSON file."""
+    with open(path) as f:
+        return json.load(f)
+
+
+def _stats_match(a, b):
+    """Check two StudyStats agree (moments to floating point round-off)."""
+    if a.outcomes.counts != b.outcomes.counts or a.events.counts != b.events.counts:
+        return False
+    for metric in METRICS:
+        if a.sketches[metric].to_dict() != b.sketches[metric].to_dict():
+            return False
+        ma, mb = a.moments[metric], b.moments[metric]
+        if (ma.n != mb.n
+                or not math.isclose(ma.mean, mb.mean, rel_tol=1e-9, abs_tol=1e-9)
+                or not math.isclose(ma.m2, mb.m2, rel_tol=1e-9, abs_tol=1e-9)):
+            return False
+    return True
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Sharded Pitch Pine Trail batch statistics.")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add_study_args(p):
+        """Add the options that define a study."""
+        p.add_argument('--runs', type=int, default=1000, help="Total games in the study")
+        p.add_argument('--shards', type=int, default=4, help="Number of shards")
+        p.add_argument('--seed', type=int, default=0, help="Study seed")
+        p.add_argument('--action', default='1', help="Fixed action when no policy is given")
+        p.add_argument('--policy', help="Policy file defining policy(status)")
+        p.add_argument('--annual', action='store_true', help="Use annual time steps")
+
+    plan = sub.add_parser('plan', help="Write shard spec files")
+    add_study_args(plan)
+    plan.add_argument('--out', default='shards', help="Directory for shard specs")
+
+    run = sub.add_parser('run', help="Run one shard spec")
+    run.add_argument('spec', help="Shard spec file")
+    run.add_argument('--out', required=True, help="Partial result file")
+
+    merge = sub.add_parser('merge', help="Merge partial result files")
+    merge.add_argument('partials', nargs='+', help="Partial result files")
+    merge.add_argument('--out', help="Also write the merged result to this file")
+
+    local = sub.add_parser('local', help="Run all shards in local processes and merge")
+    add_study_args(local)
+    local.add_argument('--workers', type=int, default=None, help="Parallel processes")
+    local.add_argument('--check', action='store_true',
+                       help="Compare against a single-process run of the whole study")
+
+    args = parser.parse_args()
+
+    if args.command == 'plan':
+        os.makedirs(args.out, exist_ok=True)
+        specs = make_shard_specs(args.runs, args.shards, args.seed, args.action, args.policy,
+                                 args.annual)
+        for spec in specs:
+            _write_json(os.path.join(args.out, f"shard_{spec['shard']}.json"), spec)
+        print(f"Wrote {len(specs)} shard specs to {args.out}")
+    elif args.command == 'run':
+        _write_json(args.out, run_shard(_read_json(args.spec)))
+    elif args.command == 'merge':
+        paths = [p for pattern in args.partials for p in sorted(glob.glob(pattern)) or [pattern]]
+        result = merge_partials([_read_json(p) for p in paths])
+        if args.out:
+            _write_json(args.out, result)
+        print(format_report(result))
+    elif args.command == 'local':
+        result = run_local(args.runs, args.shards, args.seed, args.action, args.policy,
+                           args.annual, args.workers)
+        print(format_report(result))
+        if args.check:
+            single = StudyStats.from_dict(run_shard(
+                make_shard_specs(args.runs, 1, args.seed, args.action, args.policy,
+                                 args.annual)[0]
+            )['stats'])
+            merged = StudyStats.from_dict(result['stats'])
+            print("\nMatches single-node run:", _stats_match(merged, single))
+
+
+if __name__ == "__main__":
+    main()
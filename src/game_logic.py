@@ -14,6 +14,71 @@ with different management strategies and random events.
 import random
 import math
 
+WILDFIRE_CHANCE = 0.15      # Chance of wildfire per decade at high fire risk
+SPB_CHANCE = 0.10           # Chance of SPB outbreak per decade at high SPB risk
+YEARS_PER_TURN = 10
+
+MIN_TPA = 50                # Natural mortality never thins below this
+
+# Decade effects of each action on the stand:
+# (TPA factor, TPA lost to mortality, QMD gain, carbon factor, carbon gain, CI gain)
+ACTION_EFFECTS = {
+    '1': (1.0, 20, 0.5, 1.0, 0.8, 0),       # Do nothing: natural mortality and growth
+    '2': (0.75, 0, 0.6, 0.95, 0.0, 0),      # Thin lightly
+    '3': (0.5, 0, 0.8, 0.85, 0.0, 0),       # Thin heavily
+    '4': (0.65, 0, 0.0, 0.9, 0.0, 10),      # Prescribed burn: reduces competition
+}
+NO_EFFECT = (1.0, 0, 0.0, 1.0, 0.0, 0)
+
+
+def apply_effects(stand, effects):
+    """
+    Compute stand values after applying action effects.
+
+    Args:
+        stand (dict): Stand with QMD, TPA, carbon and CI
+        effects (tuple): A row of ACTION_EFFECTS or ANNUAL_TRANSITIONS
+
+    Returns:
+        dict: New QMD, TPA, carbon, CI and BA
+    """
+    tpa_factor, tpa_loss, qmd_gain, carbon_factor, carbon_gain, ci_gain = effects
+    tpa = int(stand['TPA'] * tpa_factor - tpa_loss)
+    if tpa_loss:
+        tpa = max(tpa, MIN_TPA)
+    qmd = stand['QMD'] + qmd_gain
+    return {
+        'QMD': qmd,
+        'TPA': tpa,
+        # Apply constraints to prevent unrealistic values
+        'carbon': max(0, min(stand['carbon'] * carbon_factor + carbon_gain, 40)),
+        'CI': max(15, min(stand['CI'] + ci_gain, 60)),
+        # Calculate Basal Area using forestry formula: BA = (QMD² × 0.005454) × TPA
+        'BA': ((qmd ** 2) * 0.005454) * tpa,
+    }
+
+
+def _annual_transitions(effects):
+    """
+    Rescale a decade's effects to cumulative effects after each year.
+
+    Multiplicative factors are compounded per year and additive changes are
+    spread evenly, so row 10 reproduces the full decade.
+    """
+    tpa_factor, tpa_loss, qmd_gain, carbon_factor, carbon_gain, ci_gain = effects
+    rows = []
+    for year in range(YEARS_PER_TURN + 1):
+        frac = year / YEARS_PER_TURN
+        rows.append((
+            tpa_factor ** frac, tpa_loss * frac, qmd_gain * frac,
+            carbon_factor ** frac, carbon_gain * frac, ci_gain * frac,
+        ))
+    return rows
+
+
+# Precomputed per-year transition table for annual mode
+ANNUAL_TRANSITIONS = {action: _annual_transitions(e) for action, e in ACTION_EFFECTS.items()}
+
 class Game:
     """
     Manages the forest stand simulation, including tree growth, management actions,
@@ -22,10 +87,24 @@ class Game:
     Attributes:
         stand (dict): Forest stand characteristics and history
         low_ba_count (int): Tracks consecutive cycles with low basal area
+        rng: Source of random draws (the ``random`` module by default)
+        annual (bool): Whether turns are resolved year by year
+        turns (list): Start state, action and end state of each turn (annual mode)
     """
     
-    def __init__(self):
-        """Initialize a new game with default forest stand values."""
+    def __init__(self, rng=None, annual=False):
+        """Initialize a new game with default forest stand values.
+
+        Args:
+            rng (random.Random, optional): Seeded generator for reproducible
+                runs. Defaults to the shared ``random`` module.
+            annual (bool): Resolve each turn at annual resolution, so events
+                happen in a specific year and yearly states are available
+                from get_annual_history.
+        """
+        self.rng = rng if rng is not None else random
+        self.annual = annual
+        self.turns = []
         self.stand = {
             'year': 0,
             'QMD': 6.1,         # Quadratic Mean Diameter (inches)
@@ -57,6 +136,7 @@ class Game:
         }
         self.low_ba_count = 0
         self.pine_snakes_colonized = False
+        self.turns = []
 
     def update_stand(self, action):
         """
@@ -70,30 +150,22 @@ class Game:
                 '4': Prescribed burn
         """
         # Apply management action effects
-        if action == '1':  # Do nothing
-            self.stand['TPA'] = max(self.stand['TPA'] - 20, 50)  # Natural mortality
-            self.stand['QMD'] += 0.5  # Natural growth
-            self.stand['carbon'] += 0.8
-        elif action == '2':  # Thin lightly
-            self.stand['TPA'] = int(self.stand['TPA'] * 0.75)
-            self.stand['QMD'] += 0.6
-            self.stand['carbon'] *= 0.95
-        elif action == '3':  # Thin heavily
-            self.stand['TPA'] = int(self.stand['TPA'] * 0.5)
-            self.stand['QMD'] += 0.8
-            self.stand['carbon'] *= 0.85
-        elif action == '4':  # Prescribed burn
-            self.stand['TPA'] = int(self.stand['TPA'] * 0.65)
-            self.stand['carbon'] *= 0.9
-            self.stand['CI'] += 10  # Reduce competition
+        self.stand.update(apply_effects(self.stand, ACTION_EFFECTS.get(action, NO_EFFECT)))
+        self.update_risks()
 
-        # Apply constraints to prevent unrealistic values
-        self.stand['CI'] = max(15, min(self.stand['CI'], 60))
-        self.stand['carbon'] = max(0, min(self.stand['carbon'], 40))
+        # Track consecutive low BA cycles for game-over condition
+        if self.stand['BA'] < 35:
+            self.low_ba_count += 1
+        else:
+            self.low_ba_count = 0
 
-        # Calculate Basal Area using forestry formula: BA = (QMD² × 0.005454) × TPA
-        self.stand['BA'] = ((self.stand['QMD'] ** 2) * 0.005454) * self.stand['TPA']
+        # Pine snake colonization logic
+        if (45 <= self.stand['BA'] <= 70) and not self.pine_snakes_colonized:
+            if self.rng.random() < 0.5:
+                self.pine_snakes_colonized = True
 
+    def update_risks(self):
+        """Update fire and SPB risk labels from the current stand."""
         # Update fire risk based on Competition Index
         if self.stand['CI'] <= 20:
             self.stand['fire_risk'] = 'High'
@@ -105,17 +177,6 @@ class Game:
         # Update Southern Pine Beetle risk based on Basal Area
         self.stand['SPB_risk'] = 'High' if self.stand['BA'] > 100 else 'Moderate' if self.stand['BA'] > 60 else 'Low'
 
-        # Track consecutive low BA cycles for game-over condition
-        if self.stand['BA'] < 35:
-            self.low_ba_count += 1
-        else:
-            self.low_ba_count = 0
-
-        # Pine snake colonization logic
-        if (45 <= self.stand['BA'] <= 70) and not self.pine_snakes_colonized:
-            if random.random() < 0.5:
-                self.pine_snakes_colonized = True
-
     def is_low_ba_game_over(self):
         """Check if game should end due to consecutive low BA conditions."""
         return self.low_ba_count >= 2
@@ -130,27 +191,159 @@ class Game:
         event_log = None
 
         # Wildfire chance increases with high fire risk
-        if random.random() < 0.15 and self.stand['fire_risk'] == 'High':
-            self.stand['carbon'] *= 0.6
-            self.stand['TPA'] = int(self.stand['TPA'] * 0.4)
-            self.stand['CI'] += 15
-            event_log = 'Wildfire occurred!'
-            # Signal catastrophic wildfire for GUI
-            self.stand['catastrophic_wildfire'] = True
+        if self.rng.random() < WILDFIRE_CHANCE and self.stand['fire_risk'] == 'High':
+            event_log = self._apply_wildfire()
         else:
             self.stand['catastrophic_wildfire'] = False
 
         # SPB outbreak chance increases with high SPB risk
-        if not event_log and random.random() < 0.10 and self.stand['SPB_risk'] == 'High':
-            self.stand['TPA'] = int(self.stand['TPA'] * 0.7)
-            self.stand['BA'] *= 0.8
-            event_log = 'SPB outbreak!'
+        if not event_log and self.rng.random() < SPB_CHANCE and self.stand['SPB_risk'] == 'High':
+            event_log = self._apply_spb_outbreak()
 
         if event_log:
             self.stand['events'].append((self.stand['year'], event_log))
             return event_log
         return None
 
+    def _apply_wildfire(self):
+        """Apply wildfire losses to the stand."""
+        self.stand['carbon'] *= 0.6
+        self.stand['TPA'] = int(self.stand['TPA'] * 0.4)
+        self.stand['CI'] += 15
+        # Signal catastrophic wildfire for GUI
+        self.stand['catastrophic_wildfire'] = True
+        return 'Wildfire occurred!'
+
+    def _apply_spb_outbreak(self):
+        """Apply Southern Pine Beetle outbreak losses to the stand."""
+        self.stand['TPA'] = int(self.stand['TPA'] * 0.7)
+        self.stand['BA'] *= 0.8
+        return 'SPB outbreak!'
+
+    def simulate_annual_turn(self, action):
+        """
+        Resolve one turn year by year, with the event hazard rescaled per year.
+
+        The decade's chance of an event is turned into a constant annual hazard
+        and the year of the first event is drawn directly, so a turn costs one
+        or two random draws rather than one per year. Without an event the
+        stand ends the decade exactly as in update_stand; with one, the stand
+        is grown to the event year, the event is applied and the turn stops.
+        In that case risks are recomputed for the stand as it stands, and the
+        decade-end low BA and pine snake updates are undone (their random draw
+        is still made, so runs stay reproducible).
+
+        Args:
+            action (str): The selected management action ('1'-'4')
+
+        Returns:
+            str or None: Description of event that occurred, or None if no event
+        """
+        start = dict(self.stand)
+        low_ba_count = self.low_ba_count
+        pine_snakes_colonized = self.pine_snakes_colonized
+        self.update_stand(action)
+
+        p_fire = WILDFIRE_CHANCE if self.stand['fire_risk'] == 'High' else 0.0
+        p_spb = SPB_CHANCE if self.stand['SPB_risk'] == 'High' else 0.0
+        p_event = 1 - (1 - p_fire) * (1 - p_spb)
+
+        event_log = None
+        self.stand['catastrophic_wildfire'] = False
+        u = self.rng.random()
+        if u < p_event:
+            # Year of the first event under a constant annual hazard
+            annual_hazard = 1 - (1 - p_event) ** (1 / YEARS_PER_TURN)
+            event_year = min(int(math.log1p(-u) / math.log1p(-annual_hazard)), YEARS_PER_TURN - 1)
+            # The turn ends in the event year, so the decade-end state never happens
+            self.stand.update(self._annual_state(start, action, event_year + 1))
+            self.low_ba_count = low_ba_count
+            self.pine_snakes_colonized = pine_snakes_colonized
+            if self.rng.random() < p_fire / p_event:
+                event_log = self._apply_wildfire()
+            else:
+                event_log = self._apply_spb_outbreak()
+            self.update_risks()
+            self.stand['events'].append((start['year'] + event_year, event_log))
+            self.stand['year'] = start['year'] + event_year + 1
+        else:
+            self.stand['year'] = start['year'] + YEARS_PER_TURN
+
+        self.turns.append((start, action, dict(self.stand)))
+        return event_log
+
+    def _annual_state(self, start, action, years):
+        """
+        Stand values ``years`` into a turn, interpolated with the transition table.
+
+        Returns:
+            dict: QMD, TPA, carbon, CI and BA for that year
+        """
+        rows = ANNUAL_TRANSITIONS.get(action)
+        return apply_effects(start, rows[years] if rows else NO_EFFECT)
+
+    def get_annual_history(self):
+        """
+        Get yearly stand values for every turn played in annual mode.
+
+        Intermediate years are expanded on demand from the transition table;
+        the last year of each turn is the stand as it actually ended the turn.
+
+        Returns:
+            list: Dicts with year, QMD, TPA, BA, carbon and CI
+        """
+        history = []
+        for start, action, end in self.turns:
+            years = end['year'] - start['year']
+            for year in range(1, years):
+                history.append({
+                    'year': start['year'] + year,
+                    **self._annual_state(start, action, year),
+                })
+            history.append({k: end[k] for k in ('year', 'QMD', 'TPA', 'carbon', 'CI', 'BA')})
+        return history
+
+    def play_turn(self, action):
+        """
+        Play one full turn: apply the action, roll for events and advance time.
+
+        In annual mode the turn ends early in the year an event occurs.
+
+        Args:
+            action (str): The selected management action ('1'-'4')
+
+        Returns:
+            str or None: Description of event that occurred, or None if no event
+        """
+        if self.annual:
+            return self.simulate_annual_turn(action)
+        self.update_stand(action)
+        event = self.simulate_event()
+        self.stand['year'] += YEARS_PER_TURN
+        return event
+
+    def get_outcome(self, event):
+        """
+        Check whether the turn that produced ``event`` ended the game.
+
+        Args:
+            event (str or None): Value returned by play_turn
+
+        Returns:
+            str or None: 'wildfire', 'spb', 'low_ba' or 'complete' if the game
+            is over, otherwise None
+        """
+        if self.stand.get('catastrophic_wildfire', False):
+            return 'wildfire'
+        # Outbreaks only happen at high SPB risk, so every outbreak ends the game
+        if event == 'SPB outbreak!':
+            return 'spb'
+        if self.is_low_ba_game_over():
+            return 'low_ba'
+        if self.stand['year'] >= 100:
+            return 'complete'
+        return None
+
     def get_status(self):
         """Get current stand status as a formatted string."""
         return (
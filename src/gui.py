@@ -437,18 +437,17 @@ def main():
                 action (str): The action code selected ('1'-'4')
             """
             pine_snakes_before = game.pine_snakes_colonized
-            game.update_stand(action)
-            event = game.simulate_event()
-            game.stand['year'] += 10
+            event = game.play_turn(action)
+            outcome = game.get_outcome(event)
             status.set(game.get_status())
 
             # Catastrophic wildfire ending
-            if getattr(game.stand, 'catastrophic_wildfire', False) or game.stand.get('catastrophic_wildfire', False):
+            if outcome == 'wildfire':
                 show_fire_loss_screen()
                 return
 
             # SPB outbreak at high risk ending
-            if event == 'SPB outbreak!' and game.stand['SPB_risk'] == 'High':
+            if outcome == 'spb':
                 show_spb_loss_screen()
                 return
 
@@ -462,10 +461,10 @@ def main():
             else:
                 narration.set("What will you do next?")
 
-            if game.is_low_ba_game_over():
+            if outcome == 'low_ba':
                 show_low_ba_screen()
                 return
-            if game.stand['year'] >= 100:
+            if outcome == 'complete':
                 show_closing_screen()
                 return
 
@@ -0,0 +1,41 @@
+"""
+Pitch Pine Trail - Forest Management Simulation Game
+
+NJ Forest Service
+William Zipse
+Cara Escalona
+Justin Gimmillaro
+
+---------------------------------------------------
+Shared helpers for playing many seeded games with a policy.
+
+A policy is a Python file defining ``policy(status)``, which receives the
+output of ``Game.get_status_dict()`` and returns an action '1'-'4'.
+"""
+
+import random
+
+
+def make_scenarios(count, seed):
+    """Build a reproducible list of per-game seeds from one study seed."""
+    rng = random.Random(seed)
+    return [rng.randrange(2 ** 32) for _ in range(count)]
+
+
+def load_policy(path):
+    """
+    Load the ``policy`` function from a policy file.
+
+    Each call runs the file afresh, so module-level state is not shared
+    between the policies it returns.
+
+    Args:
+        path (str): Path to the policy file
+
+    Returns:
+        callable: The policy function
+    """
+    namespace = {'__name__': 'submitted_policy', '__file__': path}
+    with open(path) as f:
+        exec(compile(f.read(), path, 'exec'), namespace)
+    return namespace['policy']
@@ -0,0 +1,440 @@
+"""
+Pitch Pine Trail - Forest Management Simulation Game
+
+NJ Forest Service
+William Zipse
+Cara Escalona
+Justin Gimmillaro
+
+---------------------------------------------------
+Tournament runner for ranking user-submitted management policies.
+
+A policy is a Python file defining ``policy(status)``, which receives the
+output of ``Game.get_status_dict()`` and returns an action '1'-'4'. Every
+policy plays the same set of seeded scenarios. Each policy runs in its own
+worker process with per-move time and memory limits, so a policy that hangs
+or crashes only forfeits its own scenarios. Each scenario reloads the policy
+and seeds ``random`` from the scenario seed, so results are reproducible and
+independent of the number of workers.
+
+Usage:
+    python src/tournament.py policies/*.py --scenarios 50 --seed 2024
+"""
+
+import argparse
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from game_logic import Game
+from policies import make_scenarios, load_policy
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+VALID_ACTIONS = ('1', '2', '3', '4')
+PINE_SNAKE_BONUS = 5.0      # Score bonus for finishing with pine snakes
+STARTUP_TIMEOUT = 10.0      # Seconds allowed for loading a policy file
+FORFEITS = ('timeout', 'crash', 'invalid')
+
+
+def _apply_memory_limit(memory_mb):
+    """
+    Limit this process's address space.
+
+    Returns:
+        str or None: Why the limit could not be applied, or None on success
+    """
+    if resource is None:
+        return "the resource module is not available on this platform"
+    limit = memory_mb * 1024 * 1024
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    except (ValueError, OSError) as e:
+        return f"setrlimit(RLIMIT_AS) failed: {e}"
+    return None
+
+
+def _policy_worker(conn, path, memory_mb):
+    """
+    Worker process entry point: answer scenario and move requests for one policy.
+
+    The startup handshake reports whether the memory limit was applied. Each
+    scenario reloads the policy file and reseeds ``random`` from the scenario
+    seed, so no state carries over between scenarios.
+
+    Args:
+        conn: Pipe end used to receive requests and send replies
+        path (str): Path to the policy file
+        memory_mb (int or None): Address space limit for this process
+    """
+    limit_error = _apply_memory_limit(memory_mb) if memory_mb else None
+    conn.send(('ready', limit_error))
+    policy = None
+
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            return
+        if request is None:
+            return
+        kind, payload = request
+        try:
+            if kind == 'scenario':
+                random.seed(payload)
+                policy = load_policy(path)
+                conn.send(('ok', None))
+            else:
+                conn.send(('ok', policy(payload)))
+        except BaseException:
+            conn.send(('error', traceback.format_exc(limit=3)))
+
+
+def _memory_limit_probe(conn, memory_mb):
+    """Probe process entry point: report whether the memory limit can be applied."""
+    conn.send(_apply_memory_limit(memory_mb))
+
+
+def check_memory_limit(memory_mb, context):
+    """
+    Check that worker processes can be given a memory limit.
+
+    Returns:
+        str or None: Why the limit cannot be enforced, or None if it can
+    """
+    conn, child_conn = context.Pipe()
+    process = context.Process(target=_memory_limit_probe, args=(child_conn, memory_mb))
+    process.start()
+    child_conn.close()
+    try:
+        reason = conn.recv() if conn.poll(STARTUP_TIMEOUT) else "limit probe did not respond"
+    except EOFError:
+        reason = "limit probe exited without reporting"
+    process.join(STARTUP_TIMEOUT)
+    if process.is_alive():
+        process.kill()
+        process.join()
+    conn.close()
+    return reason
+
+
+class PolicyProcess:
+    """
+    Parent-side handle on a sandboxed policy worker.
+
+    Attributes:
+        path (str): Path to the policy file
+        move_timeout (float): Seconds allowed per move
+        error (str or None): Details of the last failure
+        ready (bool): Whether the worker started with its limits in force
+    """
+
+    def __init__(self, path, move_timeout, memory_mb, context):
+        """Start the worker and wait for its limit handshake."""
+        self.path = path
+        self.move_timeout = move_timeout
+        self.error = None
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_policy_worker, args=(child_conn, path, memory_mb), daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        kind, limit_error = self._receive(STARTUP_TIMEOUT)
+        self.ready = kind == 'ready' and limit_error is None
+        if kind == 'ready' and limit_error is not None:
+            self.error = f"memory limit not applied: {limit_error}"
+        if not self.ready:
+            self.close()
+
+    def _receive(self, timeout):
+        """
+        Wait for one message from the worker.
+
+        Returns:
+            tuple: (kind, payload) where kind is 'ready', 'ok', 'error',
+            'timeout' or 'crash'
+        """
+        if not self.conn.poll(timeout):
+            self.error = f"no reply within {timeout:g}s"
+            return 'timeout', None
+        try:
+            kind, payload = self.conn.recv()
+        except (EOFError, OSError):
+            self.process.join(0.5)
+            self.error = f"worker exited (code {self.process.exitcode})"
+            return 'crash', None
+        if kind == 'error':
+            self.error = payload
+        return kind, payload
+
+    def _request(self, kind, payload, timeout):
+        """
+        Send one request and wait for the reply.
+
+        Returns:
+            tuple: (result, payload) where result is 'ok', 'timeout' or 'crash'
+        """
+        try:
+            self.conn.send((kind, payload))
+        except (BrokenPipeError, OSError):
+            self.error = "worker is not running"
+            return 'crash', None
+        result, payload = self._receive(timeout)
+        if result == 'error':
+            return 'crash', None
+        return result, payload
+
+    def start_scenario(self, seed):
+        """
+        Load a fresh copy of the policy with ``random`` seeded from ``seed``.
+
+        Returns:
+            str: 'ok', 'timeout' or 'crash'
+        """
+        return self._request('scenario', seed, STARTUP_TIMEOUT)[0]
+
+    def choose(self, status):
+        """
+        Ask the policy for an action.
+
+        Returns:
+            tuple: (result, action) where result is 'ok', 'timeout', 'crash'
+            or 'invalid'
+        """
+        result, action = self._request('move', status, self.move_timeout)
+        if result != 'ok':
+            return result, None
+        if action not in VALID_ACTIONS:
+            self.error = f"invalid action {action!r}"
+            return 'invalid', None
+        return 'ok', action
+
+    def close(self):
+        """Stop the worker, killing it if it does not exit promptly."""
+        if self.conn.closed:
+            return
+        try:
+            self.conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(0.5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+def _forfeit(seed, outcome, error):
+    """Result for a scenario the policy could not play."""
+    return {
+        'seed': seed, 'outcome': outcome, 'year': 0, 'carbon': 0.0,
+        'BA': 0.0, 'TPA': 0, 'pine_snakes': False, 'score': 0.0,
+        'error': error,
+    }
+
+
+def play_scenario(worker, seed):
+    """
+    Play one seeded game with a freshly loaded copy of the policy.
+
+    Returns:
+        dict: Scenario result with outcome and final stand values
+    """
+    result = worker.start_scenario(seed)
+    if result != 'ok':
+        return _forfeit(seed, result, worker.error)
+
+    game = Game(rng=random.Random(seed))
+    outcome = None
+    while outcome is None:
+        result, action = worker.choose(game.get_status_dict())
+        if result != 'ok':
+            outcome = result
+            break
+        outcome = game.get_outcome(game.play_turn(action))
+
+    if outcome == 'complete':
+        score = game.stand['carbon']
+        if game.pine_snakes_colonized:
+            score += PINE_SNAKE_BONUS
+    else:
+        score = 0.0
+
+    return {
+        'seed': seed,
+        'outcome': outcome,
+        'year': game.stand['year'],
+        'carbon': game.stand['carbon'],
+        'BA': game.stand['BA'],
+        'TPA': game.stand['TPA'],
+        'pine_snakes': game.pine_snakes_colonized,
+        'score': score,
+        'error': worker.error if outcome in FORFEITS else None,
+    }
+
+
+def run_chunk(path, seeds, move_timeout, memory_mb, context):
+    """
+    Play a chunk of scenarios for one policy.
+
+    Every scenario starts from a fresh copy of the policy, so results do not
+    depend on how scenarios are split into chunks. A worker that times out
+    or crashes is replaced before the next scenario.
+    """
+    results = []
+    worker = None
+    for seed in seeds:
+        if worker is None:
+            worker = PolicyProcess(path, move_timeout, memory_mb, context)
+        if not worker.ready:
+            results.append(_forfeit(seed, 'crash', worker.error))
+            worker = None
+            continue
+        result = play_scenario(worker, seed)
+        results.append(result)
+        if result['outcome'] in FORFEITS:
+            worker.close()
+            worker = None
+    if worker is not None:
+        worker.close()
+    return results
+
+
+def run_tournament(policy_paths, scenarios=20, seed=0, workers=None,
+                   move_timeout=1.0, memory_mb=256):
+    """
+    Run every policy against the same seeded scenarios.
+
+    Scenarios are split into chunks so that up to ``workers`` policy
+    processes run at once. Each scenario gets a freshly loaded, freshly
+    seeded policy, so the standings do not depend on ``workers``.
+
+    Args:
+        policy_paths (list): Paths to policy files
+        scenarios (int): Number of scenarios each policy plays
+        seed (int): Seed for generating the scenario set
+        workers (int, optional): Parallel worker processes (default: CPU count)
+        move_timeout (float): Seconds allowed per move
+        memory_mb (int or None): Per-worker memory limit in MB (0 or None
+            for no limit)
+
+    Returns:
+        list: Ranked standings, best first
+
+    Raises:
+        RuntimeError: If ``memory_mb`` is set but cannot be enforced here
+    """
+    workers = workers or os.cpu_count() or 1
+    seeds = make_scenarios(scenarios, seed)
+    chunk_size = max(1, math.ceil(len(seeds) / workers))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    context = multiprocessing.get_context('spawn')
+
+    if memory_mb:
+        reason = check_memory_limit(memory_mb, context)
+        if reason is not None:
+            raise RuntimeError(
+                f"A {memory_mb} MB memory limit cannot be enforced on this platform "
+                f"({reason}). Use --memory-mb 0 to run without a memory limit."
+            )
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            path: [
+                pool.submit(run_chunk, path, chunk, move_timeout, memory_mb, context)
+                for chunk in chunks
+            ]
+            for path in policy_paths
+        }
+        standings = []
+        for path, path_futures in futures.items():
+            results = [r for future in path_futures for r in future.result()]
+            standings.append(_summarize(path, results))
+
+    standings.sort(key=lambda s: (-s['mean_score'], -s['completed'], s['policy']))
+    for rank, entry in enumerate(standings, start=1):
+        entry['rank'] = rank
+    return standings
+
+
+def _summarize(path, results):
+    """Aggregate scenario results for one policy."""
+    outcomes = {}
+    for r in results:
+        outcomes[r['outcome']] = outcomes.get(r['outcome'], 0) + 1
+    completed = [r for r in results if r['outcome'] == 'complete']
+    return {
+        'policy': os.path.splitext(os.path.basename(path))[0],
+        'path': path,
+        'mean_score': sum(r['score'] for r in results) / len(results) if results else 0.0,
+        'completed': len(completed),
+        'mean_carbon': (
+            sum(r['carbon'] for r in completed) / len(completed) if completed else 0.0
+        ),
+        'pine_snakes': sum(1 for r in completed if r['pine_snakes']),
+        'outcomes': outcomes,
+        'errors': sorted({r['error'] for r in results if r['error']}),
+        'results': results,
+    }
+
+
+def format_report(standings, move_timeout=1.0, memory_mb=256):
+    """Format tournament standings as a text table, headed by the limits in force."""
+    memory = f"{memory_mb} MB per worker" if memory_mb else "NONE (not enforced)"
+    lines = [
+        f"Limits: {move_timeout:g}s per move, memory {memory}",
+        "",
+        f"{'Rank':<5}{'Policy':<24}{'Score':>8}{'Done':>6}{'Carbon':>8}{'Snakes':>8}  Outcomes",
+        "-" * 80,
+    ]
+    for s in standings:
+        outcomes = ", ".join(f"{k}: {v}" for k, v in sorted(s['outcomes'].items()))
+        lines.append(
+            f"{s['rank']:<5}{s['policy'][:23]:<24}{s['mean_score']:>8.2f}"
+            f"{s['completed']:>6}{s['mean_carbon']:>8.1f}{s['pine_snakes']:>8}  {outcomes}"
+        )
+    for s in standings:
+        for error in s['errors']:
+            lines.append(f"\n[{s['policy']}] {error.strip()}")
+    return "\n".join(lines)
+
+
+def main():
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Rank Pitch Pine Trail policies.")
+    parser.add_argument('policies', nargs='+', help="Policy files defining policy(status)")
+    parser.add_argument('--scenarios', type=int, default=20, help="Scenarios per policy")
+    parser.add_argument('--seed', type=int, default=0, help="Scenario set seed")
+    parser.add_argument('--workers', type=int, default=None, help="Parallel worker processes")
+    parser.add_argument('--move-timeout', type=float, default=1.0, help="Seconds per move")
+    parser.add_argument('--memory-mb', type=int, default=256,
+                        help="Memory limit per worker (0 for no limit)")
+    parser.add_argument('--json', help="Also write full results to this file")
+    args = parser.parse_args()
+
+    if not args.memory_mb:
+        print("Warning: policies will run without a memory limit", file=sys.stderr)
+    try:
+        standings = run_tournament(
+            args.policies, scenarios=args.scenarios, seed=args.seed, workers=args.workers,
+            move_timeout=args.move_timeout, memory_mb=args.memory_mb,
+        )
+    except RuntimeError as e:
+        parser.exit(2, f"Error: {e}\n")
+    print(format_report(standings, args.move_timeout, args.memory_mb))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(standings, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()